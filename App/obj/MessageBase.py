@@ -1,271 +1,288 @@
+import sys
+import time
+from collections import namedtuple
 from datetime import datetime
-from abc import ABC, abstractmethod
-
-class MessageBase(ABC):
+from functools import cached_property
+
+def _is_phone_number(recipient: str) -> bool:
+    """Destinatário com formato de telefone: '+' opcional seguido apenas de dígitos."""
+    if recipient.startswith('+'):
+        recipient = recipient[1:]
+    return recipient.isdigit()
+
+# Último instante consultado: (timestamp, datetime). Mensagens criadas em
+# rajada, dentro do mesmo milissegundo, compartilham o mesmo datetime.
+_TIME_CACHE = (0.0, None)
+
+def _now() -> datetime:
+    """Equivalente a datetime.now(), reaproveitado por até 1 ms."""
+    global _TIME_CACHE
+    t = time.time()
+    cached_t, cached_date = _TIME_CACHE
+    if cached_date is None or not 0 <= t - cached_t < 0.001:
+        cached_date = datetime.fromtimestamp(t)
+        _TIME_CACHE = (t, cached_date)
+    return cached_date
+
+# Registro imutável com os detalhes de uma mensagem; campos que não se
+# aplicam ao tipo (ex.: arquivo em mensagens de texto) ficam como None.
+MessageDetails = namedtuple(
+    "MessageDetails",
+    ["tipo", "mensagem", "data_envio", "caminho_arquivo", "formato_arquivo", "duração_segundos"],
+    defaults=(None, None, None)
+)
+
+class MessageBase:
     """
-    Classe base abstrata para todos os tipos de mensagens.
-    Define a estrutura comum e o método abstrato de envio.
+    Classe base para todos os tipos de mensagens, feita para ser estendida.
+    Define a estrutura comum e o envio; cada subclasse concreta informa
+    _TIPO, _VERB e _SEND_NAME.
     """
-    def __init__(self, message: str, file_path: str = None, file_format: str = None):
-        self._message = message
-        self._file_path = file_path
-        self._file_format = file_format
-        self._send_date = datetime.now()
+    # Sem __dict__ por instância: as subclasses também declaram __slots__.
+    # Os campos públicos são somente leitura por convenção: os detalhes
+    # em cache (get_details) são derivados deles.
+    __slots__ = (
+        "message", "file_path", "file_format", "send_date", "_send_date_fmt",
+        "_details_cache"
+    )
 
-    # Encapsulamento: Propriedades de leitura
-    @property
-    def message(self) -> str:
-        return self._message
+    # Tipo exibido nos detalhes, verbo das linhas de envio e método do canal
+    # usado no envio; definidos por cada subclasse concreta
+    _TIPO = None
+    _VERB = None
+    _SEND_NAME = None
 
-    @property
-    def file_path(self) -> str:
-        return self._file_path
+    def __init__(self, message: str, file_path: str = None, file_format: str = None):
+        self.message = message
+        self.file_path = file_path
+        self.file_format = file_format
+        self.send_date = _now()
+        # Formatada sob demanda (ver _send_date_str)
+        self._send_date_fmt = None
+        # Detalhes montados no primeiro get_details (ver get_details)
+        self._details_cache = None
 
     @property
-    def file_format(self) -> str:
-        return self._file_format
+    def _send_date_str(self) -> str:
+        # A data não muda após a criação: formata uma única vez, no primeiro uso
+        text = self._send_date_fmt
+        if text is None:
+            text = self._send_date_fmt = self.send_date.strftime("%Y-%m-%d %H:%M:%S")
+        return text
+
+    def get_details(self) -> MessageDetails:
+        """Retorna um MessageDetails com os detalhes específicos da mensagem."""
+        # O conteúdo da mensagem é imutável: monta os detalhes uma única vez
+        details = self._details_cache
+        if details is None:
+            details = self._details_cache = self._build_details()
+        return details
 
-    @property
-    def send_date(self) -> datetime:
-        return self._send_date
-
-    @abstractmethod
-    def get_details(self) -> dict:
-        """Retorna um dicionário com os detalhes específicos da mensagem."""
-        return {
-            "mensagem": self._message,
-            "data_envio": self._send_date.strftime("%Y-%m-%d %H:%M:%S"),
-            "caminho_arquivo": self._file_path,
-            "formato_arquivo": self._file_format
-        }
+    def _build_details(self) -> MessageDetails:
+        return MessageDetails(
+            self._TIPO, self.message, self._send_date_str,
+            self.file_path, self.file_format
+        )
 
-    @abstractmethod
-    def send(self, channel: 'ChannelBase', recipient: str):
+    def _content(self) -> str:
+        """Conteúdo exibido no envio, independente do canal e do destinatário."""
+        return self.message
+
+    def send(self, channel: 'ChannelBase', recipient: str, prepared: tuple = None):
         """
-        Método abstrato para envio da mensagem.
-        Polimorfismo será aplicado nas classes filhas.
+        Envia a mensagem pelo método do canal indicado em _SEND_NAME
+        (send_text, send_photo...). Polimorfismo: cada classe filha define o seu.
+        'prepared' são as partes já montadas por channel._prepare (broadcast).
         """
-        pass
+        if self._SEND_NAME is None:
+            raise NotImplementedError(f"{type(self).__name__} não define _SEND_NAME.")
+        getattr(channel, self._SEND_NAME)(self, recipient, prepared)
 
 class TextMessage(MessageBase):
     """Mensagem simples de texto."""
+    __slots__ = ()
+    _TIPO = "Texto"
+    _VERB = "TEXTO"
+    _SEND_NAME = "send_text"
+
     def __init__(self, message: str):
         # Herança: Chama o construtor da classe base
         super().__init__(message)
 
-    def get_details(self) -> dict:
-        # Polimorfismo: Sobrescreve o método para retornar apenas detalhes de texto
-        base_details = super().get_details()
-        return {
-            "tipo": "Texto",
-            "mensagem": base_details["mensagem"],
-            "data_envio": base_details["data_envio"]
-        }
-
-    def send(self, channel: 'ChannelBase', recipient: str):
-        # Polimorfismo: Implementação específica de envio de texto
-        channel.send_text(self, recipient)
+class MediaMessage(MessageBase):
+    """Base para mensagens com mídia (Foto, Vídeo, Arquivo); use uma das subclasses."""
+    __slots__ = ()
 
-class MediaMessage(MessageBase, ABC):
-    """Classe base abstrata para mensagens com mídia (Foto, Vídeo, Arquivo)."""
     def __init__(self, message: str, file_path: str, file_format: str):
         # Encapsulamento: Validação de dados
         if not file_path or not file_format:
             raise ValueError("Caminho e formato do arquivo são obrigatórios para mensagens de mídia.")
         super().__init__(message, file_path, file_format)
 
-    def get_details(self) -> dict:
-        # Herança: Adiciona detalhes de arquivo aos detalhes base
-        base_details = super().get_details()
-        return {
-            "mensagem": base_details["mensagem"],
-            "data_envio": base_details["data_envio"],
-            "caminho_arquivo": base_details["caminho_arquivo"],
-            "formato_arquivo": base_details["formato_arquivo"]
-        }
+    def _content(self) -> str:
+        return f"{self.file_path} ({self.file_format}) - {self.message}"
 
 class PhotoMessage(MediaMessage):
     """Mensagem com foto."""
+    __slots__ = ()
+    _TIPO = "Foto"
+    _VERB = "FOTO"
+    _SEND_NAME = "send_photo"
+
     def __init__(self, message: str, file_path: str, file_format: str):
         super().__init__(message, file_path, file_format)
 
-    def get_details(self) -> dict:
-        # Polimorfismo: Adiciona o tipo específico
-        details = super().get_details()
-        details["tipo"] = "Foto"
-        return details
-
-    def send(self, channel: 'ChannelBase', recipient: str):
-        # Polimorfismo: Implementação específica de envio de foto
-        channel.send_photo(self, recipient)
-
 class VideoMessage(MediaMessage):
     """Mensagem com vídeo, incluindo duração."""
+    __slots__ = ("duration",)
+    _TIPO = "Vídeo"
+    _VERB = "VÍDEO"
+    _SEND_NAME = "send_video"
+
     def __init__(self, message: str, file_path: str, file_format: str, duration: int):
         super().__init__(message, file_path, file_format)
-        self._duration = duration # Encapsulamento: Atributo específico
+        self.duration = duration
 
-    @property
-    def duration(self) -> int:
-        return self._duration
-
-    def get_details(self) -> dict:
-        # Polimorfismo: Adiciona o tipo e a duração
-        details = super().get_details()
-        details["tipo"] = "Vídeo"
-        details["duração_segundos"] = self._duration
-        return details
+    def _build_details(self) -> MessageDetails:
+        # Polimorfismo: Inclui a duração nos detalhes
+        return MessageDetails(
+            self._TIPO, self.message, self._send_date_str,
+            self.file_path, self.file_format, self.duration
+        )
 
-    def send(self, channel: 'ChannelBase', recipient: str):
-        # Polimorfismo: Implementação específica de envio de vídeo
-        channel.send_video(self, recipient)
+    def _content(self) -> str:
+        return f"{self.file_path} ({self.file_format}, {self.duration}s) - {self.message}"
 
 class FileMessage(MediaMessage):
     """Mensagem com arquivo genérico."""
+    __slots__ = ()
+    _TIPO = "Arquivo"
+    _VERB = "ARQUIVO"
+    _SEND_NAME = "send_file"
+
     def __init__(self, message: str, file_path: str, file_format: str):
         super().__init__(message, file_path, file_format)
 
-    def get_details(self) -> dict:
-        # Polimorfismo: Adiciona o tipo específico
-        details = super().get_details()
-        details["tipo"] = "Arquivo"
-        return details
-
-    def send(self, channel: 'ChannelBase', recipient: str):
-        # Polimorfismo: Implementação específica de envio de arquivo
-        channel.send_file(self, recipient)
-
 # ----------------------------------------------------------------------
 # Classes de Canais
 # ----------------------------------------------------------------------
 
-class ChannelBase(ABC):
+class ChannelBase:
     """
-    Classe base abstrata para todos os canais de comunicação.
-    Define a interface de envio (Polimorfismo).
+    Classe base para todos os canais de comunicação, feita para ser estendida.
+    Define a interface de envio (Polimorfismo); as subclasses implementam send_*.
     """
-    def __init__(self, name: str, address_type: str):
-        self._name = name
-        self._address_type = address_type # Tipo de endereço: 'telefone' ou 'usuario'
-
-    @property
-    def name(self) -> str:
-        return self._name
+    # name e address_type são somente leitura por convenção: os prefixos de
+    # log são derivados deles na criação
+    __slots__ = (
+        "name", "address_type", "_address_label", "_out",
+        "_prefixes",
+        "_addr_suffix", "_validate_suffix"
+    )
 
-    @property
-    def address_type(self) -> str:
-        return self._address_type
+    # Rótulo exibido nas mensagens de envio para cada tipo de endereço
+    _ADDRESS_LABELS = {"telefone": "Telefone", "usuario": "Usuário"}
+
+    def __init__(self, name: str, address_type: str, out: list = None, address_label: str = None):
+        self.name = name
+        self.address_type = address_type # Tipo de endereço: 'telefone' ou 'usuario'
+        if address_label is None:
+            address_label = self._ADDRESS_LABELS.get(address_type, address_type)
+        self._address_label = address_label
+        # Buffer de saída compartilhado (ex.: o do MessageService). Sem buffer,
+        # cada linha é impressa imediatamente.
+        self._out = out
+
+        # Partes fixas das linhas de log: o canal não muda após a criação.
+        # Os prefixos são indexados pelo verbo da mensagem (MessageBase._VERB).
+        self._prefixes = {
+            verb: f"[{name}] Enviando {verb} para "
+            for verb in ("TEXTO", "FOTO", "VÍDEO", "ARQUIVO")
+        }
+        self._addr_suffix = f" ({address_label}): "
+        self._validate_suffix = f"' para canal {name} ({address_type})..."
 
     def _validate_recipient(self, recipient: str):
         """Método interno para validação básica do destinatário (Encapsulamento)."""
         if not recipient:
             raise ValueError("O destinatário não pode ser vazio.")
-        print(f"Validando destinatário '{recipient}' para canal {self._name} ({self._address_type})...")
-
-    # Polimorfismo: Métodos abstratos para cada tipo de mensagem
-    @abstractmethod
-    def send_text(self, message: TextMessage, recipient: str):
-        pass
-
-    @abstractmethod
-    def send_photo(self, message: PhotoMessage, recipient: str):
-        pass
-
-    @abstractmethod
-    def send_video(self, message: VideoMessage, recipient: str):
-        pass
-
-    @abstractmethod
-    def send_file(self, message: FileMessage, recipient: str):
-        pass
-
-class WhatsAppChannel(ChannelBase):
-    """Canal WhatsApp (Endereçamento por Telefone)."""
-    def __init__(self):
-        # Herança: Inicializa com nome e tipo de endereço
-        super().__init__("WhatsApp", "telefone")
+        self._write("Validando destinatário '" + recipient + self._validate_suffix)
 
-    def send_text(self, message: TextMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando TEXTO para {recipient} (Telefone): {message.message}")
-
-    def send_photo(self, message: PhotoMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando FOTO para {recipient} (Telefone): {message.file_path} ({message.file_format}) - {message.message}")
-
-    def send_video(self, message: VideoMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando VÍDEO para {recipient} (Telefone): {message.file_path} ({message.file_format}, {message.duration}s) - {message.message}")
-
-    def send_file(self, message: FileMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando ARQUIVO para {recipient} (Telefone): {message.file_path} ({message.file_format}) - {message.message}")
-
-class TelegramChannel(ChannelBase):
-    """Canal Telegram (Endereçamento por Telefone ou Usuário)."""
-    def __init__(self, address_type: str):
-        # Encapsulamento: Garante que o tipo de endereço é válido
-        if address_type not in ["telefone", "usuario"]:
-            raise ValueError("Tipo de endereço inválido para Telegram. Use 'telefone' ou 'usuario'.")
-        super().__init__("Telegram", address_type)
+    def _write(self, line: str):
+        """Acumula a linha no buffer de saída, ou imprime se não houver buffer."""
+        if self._out is None:
+            print(line)
+        else:
+            self._out.append(line + "\n")
 
-    def send_text(self, message: TextMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando TEXTO para {recipient} ({self.address_type}): {message.message}")
+    def _prepare(self, message: MessageBase) -> tuple:
+        """
+        Monta as partes da linha de envio que não dependem do destinatário:
+        o prefixo antes dele e o sufixo com o conteúdo.
+        """
+        verb = message._VERB
+        if verb is None:
+            raise NotImplementedError(f"{type(message).__name__} não define _VERB.")
+        return (self._prefixes[verb], self._addr_suffix + message._content())
 
-    def send_photo(self, message: PhotoMessage, recipient: str):
+    def _send_prepared(self, message: MessageBase, recipient: str, prepared: tuple = None):
+        """Envia para um destinatário usando as partes de _prepare (montadas aqui, se ausentes)."""
         self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando FOTO para {recipient} ({self.address_type}): {message.file_path} ({message.file_format}) - {message.message}")
+        prefix, suffix = prepared if prepared is not None else self._prepare(message)
+        self._write(prefix + recipient + suffix)
 
-    def send_video(self, message: VideoMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando VÍDEO para {recipient} ({self.address_type}): {message.file_path} ({message.file_format}, {message.duration}s) - {message.message}")
+    def send_broadcast(self, message: MessageBase, recipients: list):
+        """Envia a mesma mensagem para vários destinatários, formatando-a uma só vez."""
+        # Passa por message.send para respeitar canais que sobrescrevem send_*
+        prepared = self._prepare(message)
+        for recipient in recipients:
+            message.send(self, recipient, prepared)
 
-    def send_file(self, message: FileMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando ARQUIVO para {recipient} ({self.address_type}): {message.file_path} ({message.file_format}) - {message.message}")
+    # Polimorfismo: Um método por tipo de mensagem, implementado pelas subclasses.
+    # 'prepared', quando informado, são as partes já montadas por _prepare.
+    def send_text(self, message: TextMessage, recipient: str, prepared: tuple = None):
+        raise NotImplementedError
 
-class FacebookChannel(ChannelBase):
-    """Canal Facebook (Endereçamento por Usuário)."""
-    def __init__(self):
-        super().__init__("Facebook", "usuario")
+    def send_photo(self, message: PhotoMessage, recipient: str, prepared: tuple = None):
+        raise NotImplementedError
 
-    def send_text(self, message: TextMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando TEXTO para {recipient} (Usuário): {message.message}")
+    def send_video(self, message: VideoMessage, recipient: str, prepared: tuple = None):
+        raise NotImplementedError
 
-    def send_photo(self, message: PhotoMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando FOTO para {recipient} (Usuário): {message.file_path} ({message.file_format}) - {message.message}")
+    def send_file(self, message: FileMessage, recipient: str, prepared: tuple = None):
+        raise NotImplementedError
 
-    def send_video(self, message: VideoMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando VÍDEO para {recipient} (Usuário): {message.file_path} ({message.file_format}, {message.duration}s) - {message.message}")
+class GenericChannel(ChannelBase):
+    """
+    Canal configurável por nome e tipo de endereço.
+    Atende WhatsApp, Facebook, Instagram e serve de base para o Telegram.
+    """
+    __slots__ = ()
 
-    def send_file(self, message: FileMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando ARQUIVO para {recipient} (Usuário): {message.file_path} ({message.file_format}) - {message.message}")
+    # Todos os tipos usam o mesmo caminho de formatação (_prepare)
+    def send_text(self, message: TextMessage, recipient: str, prepared: tuple = None):
+        self._send_prepared(message, recipient, prepared)
 
-class InstagramChannel(ChannelBase):
-    """Canal Instagram (Endereçamento por Usuário)."""
-    def __init__(self):
-        super().__init__("Instagram", "usuario")
+    def send_photo(self, message: PhotoMessage, recipient: str, prepared: tuple = None):
+        self._send_prepared(message, recipient, prepared)
 
-    def send_text(self, message: TextMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando TEXTO para {recipient} (Usuário): {message.message}")
+    def send_video(self, message: VideoMessage, recipient: str, prepared: tuple = None):
+        self._send_prepared(message, recipient, prepared)
 
-    def send_photo(self, message: PhotoMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando FOTO para {recipient} (Usuário): {message.file_path} ({message.file_format}) - {message.message}")
+    def send_file(self, message: FileMessage, recipient: str, prepared: tuple = None):
+        self._send_prepared(message, recipient, prepared)
 
-    def send_video(self, message: VideoMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando VÍDEO para {recipient} (Usuário): {message.file_path} ({message.file_format}, {message.duration}s) - {message.message}")
+class TelegramChannel(GenericChannel):
+    """Canal Telegram (Endereçamento por Telefone ou Usuário)."""
+    __slots__ = ()
+    _VALID_TYPES = frozenset(("telefone", "usuario"))
 
-    def send_file(self, message: FileMessage, recipient: str):
-        self._validate_recipient(recipient)
-        print(f"[{self.name}] Enviando ARQUIVO para {recipient} (Usuário): {message.file_path} ({message.file_format}) - {message.message}")
+    def __init__(self, address_type: str, out: list = None):
+        # Encapsulamento: Garante que o tipo de endereço é válido
+        if address_type not in self._VALID_TYPES:
+            raise ValueError("Tipo de endereço inválido para Telegram. Use 'telefone' ou 'usuario'.")
+        # O Telegram exibe o próprio tipo de endereço configurado
+        super().__init__("Telegram", address_type, out, address_label=address_type)
 
 # ----------------------------------------------------------------------
 # Classe de Serviço (Facade)
@@ -276,47 +293,114 @@ class MessageService:
     Classe de serviço que atua como uma fachada para o sistema de envio.
     Gerencia a lógica de envio e a seleção do canal.
     """
+    # Canais atendidos diretamente pelo nome; cada um é o atributo homônimo
+    # (Telegram é tratado à parte, pois depende do formato do destinatário)
+    _CHANNELS = frozenset(("whatsapp", "facebook", "instagram"))
+
     def __init__(self):
-        # Inicializa os canais disponíveis
-        self.whatsapp = WhatsAppChannel()
-        self.telegram_phone = TelegramChannel("telefone")
-        self.telegram_user = TelegramChannel("usuario")
-        self.facebook = FacebookChannel()
-        self.instagram = InstagramChannel()
-
-    def send_message(self, channel_name: str, recipient: str, message: MessageBase):
-        """
-        Método principal para enviar qualquer tipo de mensagem para um canal.
-        """
-        channel_name = channel_name.lower()
+        # Buffer de saída compartilhado pelos canais, descarregado a cada envio
+        self._out_buf = []
+
+    # Canais disponíveis: criados apenas no primeiro uso
+    @cached_property
+    def whatsapp(self) -> GenericChannel:
+        return GenericChannel("WhatsApp", "telefone", self._out_buf)
+
+    @cached_property
+    def telegram_phone(self) -> TelegramChannel:
+        return TelegramChannel("telefone", self._out_buf)
+
+    @cached_property
+    def telegram_user(self) -> TelegramChannel:
+        return TelegramChannel("usuario", self._out_buf)
+
+    @cached_property
+    def facebook(self) -> GenericChannel:
+        return GenericChannel("Facebook", "usuario", self._out_buf)
+
+    @cached_property
+    def instagram(self) -> GenericChannel:
+        return GenericChannel("Instagram", "usuario", self._out_buf)
 
-        # Seleção do canal e tipo de endereço
-        if channel_name == "whatsapp":
-            channel = self.whatsapp
-        elif channel_name == "telegram":
+    def _select_channel(self, channel_name: str, is_phone: bool) -> ChannelBase:
+        """Seleciona o canal (e o tipo de endereço) a partir do nome já normalizado."""
+        if channel_name == "telegram":
             # Lógica para escolher entre telefone ou usuário no Telegram
             # Assumimos que se o destinatário for um número, é telefone, senão é usuário.
             # Em um sistema real, essa lógica seria mais robusta.
-            if recipient.replace('+', '').isdigit():
-                channel = self.telegram_phone
-            else:
-                channel = self.telegram_user
-        elif channel_name == "facebook":
-            channel = self.facebook
-        elif channel_name == "instagram":
-            channel = self.instagram
-        else:
+            if is_phone:
+                return self.telegram_phone
+            return self.telegram_user
+
+        if channel_name not in self._CHANNELS:
             raise ValueError(f"Canal '{channel_name}' não suportado.")
+        return getattr(self, channel_name)
+
+    def _check_address(self, channel: ChannelBase, recipient: str, is_phone: bool):
+        """Avisa se o tipo de endereço do canal não é compatível com o destinatário."""
+        # Caso comum (tipos compatíveis): uma única comparação, nenhum texto montado
+        expects_phone = channel.address_type == "telefone"
+        if expects_phone != is_phone:
+            expected = "um número de telefone" if expects_phone else "um nome de usuário"
+            self._out_buf.append(f"AVISO: O canal {channel.name} espera {expected}, mas recebeu '{recipient}'. Tentando enviar mesmo assim.\n")
+
+    def _flush(self, out: list = None):
+        """Descarrega o buffer interno em stdout, ou no 'out' do chamador, se informado."""
+        buf = self._out_buf
+        if out is None:
+            sys.stdout.writelines(buf)
+        else:
+            out.extend(buf)
+        buf.clear()
 
-        # Verifica se o tipo de endereço do canal é compatível com o destinatário
-        if channel.address_type == "telefone" and not recipient.replace('+', '').isdigit():
-            print(f"AVISO: O canal {channel.name} espera um número de telefone, mas recebeu '{recipient}'. Tentando enviar mesmo assim.")
-        elif channel.address_type == "usuario" and recipient.replace('+', '').isdigit():
-            print(f"AVISO: O canal {channel.name} espera um nome de usuário, mas recebeu '{recipient}'. Tentando enviar mesmo assim.")
+    def send_message(self, channel_name: str, recipient: str, message: MessageBase, out: list = None):
+        """
+        Método principal para enviar qualquer tipo de mensagem para um canal.
+        Se 'out' for informado, as linhas geradas são acumuladas nele em vez
+        de escritas em stdout.
+        """
+        is_phone = _is_phone_number(recipient)
+        channel = self._select_channel(channel_name.lower(), is_phone)
 
-        # Polimorfismo: O objeto 'message' sabe como se enviar para o 'channel'
-        message.send(channel, recipient)
-        print(f"Detalhes da Mensagem Enviada: {message.get_details()}")
+        try:
+            self._check_address(channel, recipient, is_phone)
+
+            # Polimorfismo: O objeto 'message' sabe como se enviar para o 'channel'
+            message.send(channel, recipient)
+            self._out_buf.append(f"Detalhes da Mensagem Enviada: {message.get_details()}\n")
+        finally:
+            # Uma única escrita por envio, mesmo em caso de erro
+            self._flush(out)
+
+    def send_broadcast(self, channel_name: str, recipients: list, message: MessageBase, out: list = None):
+        """
+        Envia a mesma mensagem para vários destinatários de um canal.
+        Os detalhes são impressos uma única vez, ao final, e a linha de envio
+        é montada uma única vez por canal efetivo (telefone/usuário no Telegram).
+        """
+        channel_name = channel_name.lower()
+        # Valida o canal antes de qualquer envio. No Telegram o canal efetivo
+        # (telefone/usuário) depende de cada destinatário.
+        fixed_channel = None
+        if channel_name != "telegram":
+            fixed_channel = self._select_channel(channel_name, False)
+        if not recipients:
+            # Nada foi enviado: não há detalhes a exibir
+            return
+
+        prepared = {}
+        try:
+            for recipient in recipients:
+                is_phone = _is_phone_number(recipient)
+                channel = fixed_channel if fixed_channel is not None else self._select_channel(channel_name, is_phone)
+                self._check_address(channel, recipient, is_phone)
+                parts = prepared.get(channel)
+                if parts is None:
+                    parts = prepared[channel] = channel._prepare(message)
+                message.send(channel, recipient, parts)
+            self._out_buf.append(f"Detalhes da Mensagem Enviada: {message.get_details()}\n")
+        finally:
+            self._flush(out)
 
 # ----------------------------------------------------------------------
 # Exemplo de Uso
@@ -350,33 +434,40 @@ def run_example():
         file_format="PDF"
     )
 
-    print("="*50)
-    print("TESTE DE ENVIO DE MENSAGENS")
-    print("="*50)
-
-    # Teste 1: WhatsApp (Telefone) - Texto
-    print("\n--- Teste 1: WhatsApp (Texto) ---")
-    service.send_message("whatsapp", "+5511987654321", text_msg)
-
-    # Teste 2: Facebook (Usuário) - Foto
-    print("\n--- Teste 2: Facebook (Foto) ---")
-    service.send_message("facebook", "usuario_facebook_id", photo_msg)
-
-    # Teste 3: Telegram (Telefone) - Vídeo
-    print("\n--- Teste 3: Telegram (Vídeo - Telefone) ---")
-    service.send_message("telegram", "+1234567890", video_msg)
-
-    # Teste 4: Instagram (Usuário) - Arquivo (Nota: Arquivos genéricos podem não ser suportados no Instagram real)
-    print("\n--- Teste 4: Instagram (Arquivo) ---")
-    service.send_message("instagram", "@meu_perfil", file_msg)
-
-    # Teste 5: Telegram (Usuário) - Texto
-    print("\n--- Teste 5: Telegram (Texto - Usuário) ---")
-    service.send_message("telegram", "meu_username_telegram", text_msg)
-
-    # Teste 6: WhatsApp (Telefone) - Vídeo
-    print("\n--- Teste 6: WhatsApp (Vídeo) ---")
-    service.send_message("whatsapp", "+5511987654321", video_msg)
+    # Toda a saída do exemplo é acumulada e escrita de uma só vez no final
+    out = []
+    separator = "=" * 50 + "\n"
+    out.append(separator)
+    out.append("TESTE DE ENVIO DE MENSAGENS\n")
+    out.append(separator)
+
+    try:
+        # Teste 1: WhatsApp (Telefone) - Texto
+        out.append("\n--- Teste 1: WhatsApp (Texto) ---\n")
+        service.send_message("whatsapp", "+5511987654321", text_msg, out)
+
+        # Teste 2: Facebook (Usuário) - Foto
+        out.append("\n--- Teste 2: Facebook (Foto) ---\n")
+        service.send_message("facebook", "usuario_facebook_id", photo_msg, out)
+
+        # Teste 3: Telegram (Telefone) - Vídeo
+        out.append("\n--- Teste 3: Telegram (Vídeo - Telefone) ---\n")
+        service.send_message("telegram", "+1234567890", video_msg, out)
+
+        # Teste 4: Instagram (Usuário) - Arquivo (Nota: Arquivos genéricos podem não ser suportados no Instagram real)
+        out.append("\n--- Teste 4: Instagram (Arquivo) ---\n")
+        service.send_message("instagram", "@meu_perfil", file_msg, out)
+
+        # Teste 5: Telegram (Usuário) - Texto
+        out.append("\n--- Teste 5: Telegram (Texto - Usuário) ---\n")
+        service.send_message("telegram", "meu_username_telegram", text_msg, out)
+
+        # Teste 6: WhatsApp (Telefone) - Vídeo
+        out.append("\n--- Teste 6: WhatsApp (Vídeo) ---\n")
+        service.send_message("whatsapp", "+5511987654321", video_msg, out)
+    finally:
+        # Mesmo se algum envio falhar, a saída acumulada até ali é escrita
+        sys.stdout.writelines(out)
 
 if __name__ == '__main__':
     run_example()